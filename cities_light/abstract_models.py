@@ -1,21 +1,26 @@
 # -*- coding: utf-8 -*-
 
-import re
+import string
+from functools import lru_cache
+
 import autoslug
 import pytz
+from autoslug.settings import slugify as autoslug_slugify
 
 from django.utils.encoding import python_2_unicode_compatible
 
 from django.db import models
 from django.db.models import lookups
 from django.utils.encoding import force_text
+from django.utils.functional import cached_property
 from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 from django.utils.translation import ugettext_lazy as _
 
 from unidecode import unidecode
 
-from .validators import timezone_validator
-from .settings import INDEX_SEARCH_NAMES, CITIES_LIGHT_APP_NAME
+from .validators import get_timezone, timezone_validator
+from .settings import CITIES_LIGHT_APP_NAME
 
 from general.constants import STATE_TYPES
 from general.managers import TranslateEntityManager, CustomEntityManager
@@ -36,7 +41,42 @@ CONTINENT_CHOICES = (
     ('AS', _('Asia')),
 )
 
-ALPHA_REGEXP = re.compile('[\W_]+', re.UNICODE)
+# Codepoint -> ASCII mapping for Latin-1 Supplement and Latin Extended-A/B,
+# which covers the vast majority of geonames names. Built lazily by
+# _get_ascii_table() and consumed by str.translate().
+_ASCII_TABLE = None
+_ASCII_TABLE_LIMIT = '\u0250'
+
+
+def _get_ascii_table():
+    # Tables are built in a local dict and published with a single
+    # assignment, so concurrent callers never see them half filled
+    global _ASCII_TABLE
+    if _ASCII_TABLE is None:
+        _ASCII_TABLE = {
+            i: unidecode(chr(i))
+            for i in range(0x80, ord(_ASCII_TABLE_LIMIT))
+        }
+    return _ASCII_TABLE
+
+
+# Codepoint -> to_search() fragment for the same range plus ASCII: letters
+# and digits are transliterated and lowercased, everything else is deleted.
+# Built lazily by _get_search_table().
+_SEARCH_TABLE = None
+
+
+def _get_search_table():
+    global _SEARCH_TABLE
+    if _SEARCH_TABLE is None:
+        alnum = set(string.ascii_lowercase + string.digits)
+        table = {}
+        for i in range(ord(_ASCII_TABLE_LIMIT)):
+            fragment = ''.join(
+                c for c in _to_ascii(chr(i)).lower() if c in alnum)
+            table[i] = fragment or None
+        _SEARCH_TABLE = table
+    return _SEARCH_TABLE
 
 
 def to_ascii(value):
@@ -44,7 +84,24 @@ def to_ascii(value):
     Convert a unicode value to ASCII-only unicode string.
 
     For example, 'République Françaisen' would become 'Republique Francaisen'
+
+    ASCII input is returned as is and Latin input is converted with a
+    precomputed translation table, unidecode() is only called for other
+    scripts.
     """
+    return _to_ascii(force_text(value))
+
+
+@lru_cache(maxsize=65536)
+def _to_ascii(value):
+    if not value:
+        return value
+
+    highest = max(value)
+    if highest < '\x80':
+        return value
+    if highest < _ASCII_TABLE_LIMIT:
+        return value.translate(_get_ascii_table())
     return force_text(unidecode(value))
 
 
@@ -55,8 +112,55 @@ def to_search(value):
 
     For example, 'Paris Texas' would become 'paristexas'.
     """
+    return _to_search(force_text(value))
+
+
+def to_search_array(values):
+    """
+    Convert a sequence of string values with to_search(), return a list.
+
+    to_search() works character by character, so the search string of
+    concatenated values is the concatenation of their search strings. This
+    lets callers convert each name once and build combinations afterwards.
+    """
+    return [_to_search(force_text(value)) for value in values]
+
+
+# Geonames names repeat a lot (country and region names are part of every
+# city search_names), so results are memoized on the text value.
+@lru_cache(maxsize=131072)
+def _to_search(value):
+    if value and max(value) >= _ASCII_TABLE_LIMIT:
+        value = _to_ascii(value)
+    return value.translate(_get_search_table())
+
+
+def to_slug(value):
+    """
+    Memoized version of the slugify function configured for autoslug.
+
+    Slug fields are re-slugified on every save, even when they are already
+    set, so this mostly hits the cache during imports.
+    """
+    return _to_slug(force_text(value))
+
 
-    return ALPHA_REGEXP.sub('', to_ascii(value)).lower()
+# Not decorating to_slug() itself so that migrations can serialize it
+@lru_cache(maxsize=65536)
+def _to_slug(value):
+    return autoslug_slugify(value)
+
+
+def geoname_id_unique_constraint(name):
+    """
+    Return a unique constraint on geoname_id which leaves out NULL rows,
+    keeping the index small for records which are not from geonames.
+    """
+    return models.UniqueConstraint(
+        fields=['geoname_id'],
+        condition=models.Q(geoname_id__isnull=False),
+        name=name,
+    )
 
 
 @python_2_unicode_compatible
@@ -66,8 +170,9 @@ class Base(models.Model):
     """
 
     name_ascii = models.CharField(max_length=200, blank=True, db_index=True)
-    slug = autoslug.AutoSlugField(populate_from='name_ascii')
-    geoname_id = models.IntegerField(null=True, blank=True, unique=True)
+    slug = autoslug.AutoSlugField(populate_from='name_ascii', slugify=to_slug)
+    # Unique when set, see geoname_id_unique_constraint()
+    geoname_id = models.IntegerField(null=True, blank=True)
     alternate_names = models.TextField(null=True, blank=True, default='')
 
     state = models.SmallIntegerField(verbose_name=_('Publish state'), choices=STATE_TYPES, default=1)
@@ -78,9 +183,6 @@ class Base(models.Model):
         # ordering = ['name']
 
     def __str__(self):
-        display_name = getattr(self, 'display_name', None)
-        if display_name:
-            return display_name
         return self.name
 
 
@@ -108,8 +210,7 @@ class AbstractCountry(Base, TranslatableModel):
 
     code2 = models.CharField(max_length=2, null=True, blank=True, unique=True)
     code3 = models.CharField(max_length=3, null=True, blank=True, unique=True)
-    continent = models.CharField(max_length=2, db_index=True,
-                                 choices=CONTINENT_CHOICES)
+    continent = models.CharField(max_length=2, choices=CONTINENT_CHOICES)
     tld = models.CharField(max_length=5, blank=True, db_index=True)
     phone = models.CharField(max_length=20, null=True, blank=True)
 
@@ -119,11 +220,13 @@ class AbstractCountry(Base, TranslatableModel):
     published = TranslateEntityManager()
 
     class Meta(Base.Meta):
+        constraints = [
+            geoname_id_unique_constraint('country_geoname_id_uniq'),
+        ]
         verbose_name_plural = _('countries')
         abstract = True
-        ordering = ['name']
 
-    @property
+    @cached_property
     def name_(self):
         return self.name
 
@@ -169,21 +272,38 @@ class AbstractRegion(Base, TranslatableModel):
 
     class Meta(Base.Meta):
         unique_together = (('country', 'slug'))
+        indexes = [
+            models.Index(fields=['country', 'geoname_code'],
+                         name='region_country_code_idx'),
+        ]
+        constraints = [
+            geoname_id_unique_constraint('region_geoname_id_uniq'),
+        ]
         verbose_name = _('region/state')
         verbose_name_plural = _('regions/states')
         abstract = True
-        ordering = ['name']
 
-    @property
+    @cached_property
     def name_(self):
         return self.name
 
+    def __str__(self):
+        return self.display_name or self.name
+
     def get_display_name(self):
         return '%s, %s' % (self.name, self.country.name)
 
 
-class ToSearchIContainsLookup(lookups.IContains):
-    """IContains lookup for ToSearchTextField."""
+class ToSearchIContainsLookup(lookups.Contains):
+    """
+    IContains lookup for ToSearchTextField.
+
+    search_names and to_search() output are both lowercase, so this compiles
+    to a plain LIKE instead of UPPER(...) LIKE UPPER(...), which lets
+    PostgreSQL use the city_search_trgm trigram index.
+    """
+
+    lookup_name = 'icontains'
 
     def get_prep_lookup(self):
         """Return the value passed through to_search()."""
@@ -227,21 +347,18 @@ class AbstractCity(Base, TranslatableModel):
         meta={'unique_together': [('name', 'language_code', 'master')]},
     )
 
+    # Substring lookups can't use a b-tree index, PostgreSQL gets a trigram
+    # index from migrations instead (see 0003_city_search_names_trgm)
     search_names = ToSearchTextField(
         max_length=4000,
-        db_index=INDEX_SEARCH_NAMES,
         blank=True,
         default='')
 
-    latitude = models.DecimalField(
-        max_digits=8,
-        decimal_places=5,
+    latitude = models.FloatField(
         null=True,
         blank=True)
 
-    longitude = models.DecimalField(
-        max_digits=8,
-        decimal_places=5,
+    longitude = models.FloatField(
         null=True,
         blank=True)
 
@@ -249,9 +366,15 @@ class AbstractCity(Base, TranslatableModel):
                                null=True, on_delete=models.CASCADE)
     country = models.ForeignKey(CITIES_LIGHT_APP_NAME + '.Country',
                                 on_delete=models.CASCADE)
+    # Denormalized region.name and country.name in settings.LANGUAGE_CODE,
+    # maintained by receivers so that the admin changelist does not need to
+    # join Region and Country
+    region_name_cache = models.CharField(max_length=200, blank=True,
+                                         default='', editable=False)
+    country_name_cache = models.CharField(max_length=200, blank=True,
+                                          default='', editable=False)
     population = models.BigIntegerField(null=True, blank=True, db_index=True)
-    feature_code = models.CharField(max_length=10, null=True, blank=True,
-                                    db_index=True)
+    feature_code = models.CharField(max_length=10, null=True, blank=True)
     timezone = models.CharField(max_length=40, blank=True, null=True,
                                 db_index=True, validators=[timezone_validator])
 
@@ -262,20 +385,31 @@ class AbstractCity(Base, TranslatableModel):
 
     class Meta(Base.Meta):
         unique_together = (('region', 'slug'))
+        indexes = [
+            models.Index(fields=['country', 'timezone'],
+                         name='city_country_tz_idx'),
+            models.Index(fields=['country', 'population'],
+                         name='city_country_pop_idx'),
+        ]
+        constraints = [
+            geoname_id_unique_constraint('city_geoname_id_uniq'),
+        ]
         verbose_name_plural = _('cities')
         abstract = True
-        ordering = ['name']
 
-    @property
+    @cached_property
     def name_(self):
         return self.name
 
+    def __str__(self):
+        return self.display_name or self.name
+
     def get_display_name(self):
         if self.region_id:
             try:
                 return '%s, %s, %s' % (self.name, self.region.name,
-                                   self.country.name)
-            except:
+                                       self.country.name)
+            except ObjectDoesNotExist:
                 return '%s, %s' % (self.name, self.country.name)
 
         else:
@@ -288,6 +422,6 @@ class AbstractCity(Base, TranslatableModel):
         for value specified in settings.TIME_ZONE.
         """
         try:
-            return pytz.timezone(self.timezone)
+            return get_timezone(self.timezone)
         except (pytz.UnknownTimeZoneError, AttributeError):
-            return pytz.timezone(settings.TIME_ZONE)
+            return get_timezone(settings.TIME_ZONE)
@@ -1,7 +1,4 @@
-from copy import copy
-
 from django.contrib import admin
-from django.contrib.admin.views.main import ChangeList
 
 from .forms import *
 from .abstract_models import to_search
@@ -37,6 +34,7 @@ class CountryAdmin(CustomTranslatableAdmin):
     list_filter = (
         'continent',
     )
+    ordering = ('name_ascii',)
     form = CountryForm
 
 
@@ -61,8 +59,13 @@ class RegionAdmin(CustomTranslatableAdmin):
         'get_country',
         'geoname_id',
     )
+    ordering = ('name_ascii',)
     form = RegionForm
 
+    def get_queryset(self, request):
+        return super(RegionAdmin, self).get_queryset(request).select_related(
+            'country')
+
     def get_country(self, obj):
         return obj.country
 
@@ -70,14 +73,6 @@ class RegionAdmin(CustomTranslatableAdmin):
 admin.site.register(Region, RegionAdmin)
 
 
-class CityChangeList(ChangeList):
-    def get_queryset(self, request):
-        if 'q' in list(request.GET.keys()):
-            request.GET = copy(request.GET)
-            request.GET['q'] = to_search(request.GET['q'])
-        return super(CityChangeList, self).get_queryset(request)
-
-
 class CityAdmin(CustomTranslatableAdmin):
     """
     ModelAdmin for City.
@@ -99,17 +94,31 @@ class CityAdmin(CustomTranslatableAdmin):
         'country',
         'timezone'
     )
+    ordering = ('-population', 'name_ascii')
     form = CityForm
 
-    def get_changelist(self, request, **kwargs):
-        return CityChangeList
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search for the to_search() form of the whole term, like
+        City.search_names values.
+        """
+        return super(CityAdmin, self).get_search_results(
+            request, queryset, to_search(search_term))
+
+    def get_queryset(self, request):
+        # region and country are only read when their name cache is empty,
+        # ie. when they have no settings.LANGUAGE_CODE translation
+        return super(CityAdmin, self).get_queryset(request).select_related(
+            'region', 'country')
 
     def get_region(selfs, obj):
-        return obj.region
+        if obj.region_name_cache or not obj.region_id:
+            return obj.region_name_cache
+        return obj.region.name
     get_region.short_description = 'region'
 
     def get_country(self, obj):
-        return obj.country
+        return obj.country_name_cache or obj.country.name
     get_country.short_description = 'country'
 
 
@@ -42,7 +42,7 @@ class CountryLookup(StandardLookupChannel):
         return Country.objects.filter(
             Q(name__icontains=q) |
             Q(name_ascii__icontains=q)
-        ).distinct()
+        ).order_by('name_ascii').distinct()
 
 
 class RegionLookup(StandardLookupChannel):
@@ -56,7 +56,7 @@ class RegionLookup(StandardLookupChannel):
         return Region.objects.filter(
             Q(name__icontains=q) |
             Q(name_ascii__icontains=q)
-        ).distinct()
+        ).order_by('name_ascii').distinct()
 
 
 class CityLookup(StandardLookupChannel):
@@ -67,4 +67,4 @@ class CityLookup(StandardLookupChannel):
 
     def get_query(self, q, request):
         return City.objects.filter(search_names__icontains=q
-            ).select_related('country').distinct()
+            ).select_related('country').order_by('name_ascii').distinct()
@@ -41,7 +41,7 @@ class CitySerializer(HyperlinkedModelSerializer):
 
     class Meta:
         model = City
-        exclude = ('slug',)
+        exclude = ('slug', 'region_name_cache', 'country_name_cache')
 
 
 class RegionSerializer(HyperlinkedModelSerializer):
@@ -85,12 +85,12 @@ class CitiesLightListModelViewSet(viewsets.ReadOnlyModelViewSet):
 
 class CountryModelViewSet(CitiesLightListModelViewSet):
     serializer_class = CountrySerializer
-    queryset = Country.objects.all()
+    queryset = Country.objects.order_by('name_ascii')
 
 
 class RegionModelViewSet(CitiesLightListModelViewSet):
     serializer_class = RegionSerializer
-    queryset = Region.objects.all()
+    queryset = Region.objects.order_by('name_ascii')
 
 
 class CityModelViewSet(CitiesLightListModelViewSet):
@@ -98,7 +98,7 @@ class CityModelViewSet(CitiesLightListModelViewSet):
     ListRetrieveView for City.
     """
     serializer_class = CitySerializer
-    queryset = City.objects.all()
+    queryset = City.objects.order_by('name_ascii')
 
     def get_queryset(self):
         """
@@ -422,16 +422,19 @@ It is possible to force the import of files which weren't downloaded using the
             city.name_ascii = items[ICity.asciiName]
             save = True
 
-        if city.latitude != items[ICity.latitude]:
-            city.latitude = items[ICity.latitude]
+        latitude = float(items[ICity.latitude])
+        if city.latitude != latitude:
+            city.latitude = latitude
             save = True
 
-        if city.longitude != items[ICity.longitude]:
-            city.longitude = items[ICity.longitude]
+        longitude = float(items[ICity.longitude])
+        if city.longitude != longitude:
+            city.longitude = longitude
             save = True
 
-        if city.population != items[ICity.population]:
-            city.population = items[ICity.population]
+        population = int(items[ICity.population])
+        if city.population != population:
+            city.population = population
             save = True
 
         if city.feature_code != items[ICity.featureCode]:
@@ -0,0 +1,37 @@
+"""Management command to rebuild denormalized City name caches."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...loading import get_cities_models
+
+Country, Region, City = get_cities_models()
+
+
+class Command(BaseCommand):
+    """Management command to rebuild denormalized City name caches."""
+
+    help = """
+Rebuild City.country_name_cache and City.region_name_cache from the Country
+and Region translations in the given language (settings.LANGUAGE_CODE by
+default). Run it after migrating, or after changing names without
+triggering the model signals (ie. with QuerySet.update()).
+    """.strip()
+
+    def add_arguments(self, parser):
+        parser.add_argument('--language', default=settings.LANGUAGE_CODE,
+            help='Language code of the names to cache'
+        )
+
+    def handle(self, *args, **options):
+        language = options['language']
+
+        for model_class, cache_field in ((Country, 'country_name_cache'),
+                                         (Region, 'region_name_cache')):
+            fk_field = '%s_id' % model_class.__name__.lower()
+            names = model_class._meta.translations_model.objects.filter(
+                language_code=language).values_list('master_id', 'name')
+
+            for pk, name in names.iterator():
+                City.objects.filter(**{fk_field: pk}).exclude(
+                    **{cache_field: name}).update(**{cache_field: name})
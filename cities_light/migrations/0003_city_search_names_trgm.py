@@ -0,0 +1,45 @@
+from django.db import migrations
+
+from ._pg_trgm import create_pg_trgm_extension
+
+
+def create_search_names_trgm_index(apps, schema_editor):
+    """
+    Index City.search_names for substring search on PostgreSQL.
+
+    Other database backends have no trigram index support, they keep
+    scanning the table.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    city_table = apps.get_model('cities_light', 'City')._meta.db_table
+    if not create_pg_trgm_extension(schema_editor):
+        return
+
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS city_search_trgm ON %s '
+        'USING gin (search_names gin_trgm_ops)' %
+        schema_editor.quote_name(city_table)
+    )
+
+
+def drop_search_names_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    schema_editor.execute('DROP INDEX IF EXISTS city_search_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0002_auto_20191001_0605'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_search_names_trgm_index,
+            drop_search_names_trgm_index,
+        ),
+    ]
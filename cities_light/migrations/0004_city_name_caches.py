@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_city_name_caches(apps, schema_editor):
+    """
+    Fill City name caches from Country and Region names in
+    settings.LANGUAGE_CODE, like the rebuild_city_denorm command.
+    """
+    City = apps.get_model('cities_light', 'City')
+
+    for model_name, cache_field in (('Country', 'country_name_cache'),
+                                    ('Region', 'region_name_cache')):
+        translations = apps.get_model('cities_light',
+                                      model_name + 'Translation')
+        fk_field = '%s_id' % model_name.lower()
+        names = translations.objects.filter(
+            language_code=settings.LANGUAGE_CODE
+        ).values_list('master_id', 'name')
+
+        for pk, name in names.iterator():
+            City.objects.filter(**{fk_field: pk}).update(**{cache_field: name})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0003_city_search_names_trgm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='city',
+            name='country_name_cache',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='city',
+            name='region_name_cache',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(fill_city_name_caches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0005_city_coordinates_float'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='region',
+            index=models.Index(fields=['country', 'geoname_code'], name='region_country_code_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['country', 'timezone'], name='city_country_tz_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='city',
+            index=models.Index(fields=['country', 'population'], name='city_country_pop_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+from django.db import migrations, models
+
+
+CONSTRAINTS = (
+    ('country', 'country_geoname_id_uniq'),
+    ('region', 'region_geoname_id_uniq'),
+    ('city', 'city_geoname_id_uniq'),
+)
+
+
+def geoname_id_field(model, unique):
+    field = models.IntegerField(blank=True, null=True, unique=unique)
+    field.set_attributes_from_name('geoname_id')
+    field.model = model
+    return field
+
+
+def geoname_id_constraint(name):
+    return models.UniqueConstraint(
+        condition=models.Q(geoname_id__isnull=False),
+        fields=['geoname_id'],
+        name=name,
+    )
+
+
+def use_partial_unique(apps, schema_editor):
+    """
+    Replace the geoname_id unique index with a partial one.
+
+    Backends without partial index support (ie. MySQL) would not create the
+    constraint at all, so they keep the existing unique index.
+    """
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+
+    for model_name, constraint_name in CONSTRAINTS:
+        model = apps.get_model('cities_light', model_name)
+        schema_editor.alter_field(model, geoname_id_field(model, True),
+                                  geoname_id_field(model, False))
+        schema_editor.add_constraint(model,
+                                     geoname_id_constraint(constraint_name))
+
+
+def use_full_unique(apps, schema_editor):
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+
+    for model_name, constraint_name in CONSTRAINTS:
+        model = apps.get_model('cities_light', model_name)
+        schema_editor.remove_constraint(model,
+                                        geoname_id_constraint(constraint_name))
+        schema_editor.alter_field(model, geoname_id_field(model, False),
+                                  geoname_id_field(model, True))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0006_city_region_composite_indexes'),
+    ]
+
+    state_operations = []
+    for model_name, constraint_name in CONSTRAINTS:
+        state_operations += [
+            migrations.AlterField(
+                model_name=model_name,
+                name='geoname_id',
+                field=models.IntegerField(blank=True, null=True),
+            ),
+            migrations.AddConstraint(
+                model_name=model_name,
+                constraint=geoname_id_constraint(constraint_name),
+            ),
+        ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(use_partial_unique, use_full_unique),
+            ],
+            state_operations=state_operations,
+        ),
+    ]
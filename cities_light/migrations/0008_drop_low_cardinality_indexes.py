@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0007_geoname_id_partial_unique'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='country',
+            name='continent',
+            field=models.CharField(choices=[('OC', 'Oceania'), ('EU', 'Europe'), ('AF', 'Africa'), ('NA', 'North America'), ('AN', 'Antarctica'), ('SA', 'South America'), ('AS', 'Asia')], max_length=2),
+        ),
+        migrations.AlterField(
+            model_name='city',
+            name='feature_code',
+            field=models.CharField(blank=True, max_length=10, null=True),
+        ),
+    ]
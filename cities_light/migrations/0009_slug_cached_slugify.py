@@ -0,0 +1,28 @@
+import autoslug.fields
+import cities_light.abstract_models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0008_drop_low_cardinality_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='city',
+            name='slug',
+            field=autoslug.fields.AutoSlugField(editable=False, populate_from='name_ascii', slugify=cities_light.abstract_models.to_slug),
+        ),
+        migrations.AlterField(
+            model_name='country',
+            name='slug',
+            field=autoslug.fields.AutoSlugField(editable=False, populate_from='name_ascii', slugify=cities_light.abstract_models.to_slug),
+        ),
+        migrations.AlterField(
+            model_name='region',
+            name='slug',
+            field=autoslug.fields.AutoSlugField(editable=False, populate_from='name_ascii', slugify=cities_light.abstract_models.to_slug),
+        ),
+    ]
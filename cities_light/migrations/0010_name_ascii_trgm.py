@@ -0,0 +1,54 @@
+from django.db import migrations
+
+from ._pg_trgm import create_pg_trgm_extension
+
+
+INDEXES = (
+    ('Country', 'country_name_ascii_trgm'),
+    ('Region', 'region_name_ascii_trgm'),
+)
+
+
+def create_name_ascii_trgm_indexes(apps, schema_editor):
+    """
+    Index name_ascii for icontains lookups on PostgreSQL.
+
+    Django compiles icontains to UPPER(column) LIKE UPPER(value), so the
+    trigram index is on UPPER(name_ascii). Other database backends have no
+    trigram index support.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    if not create_pg_trgm_extension(schema_editor):
+        return
+
+    for model_name, index_name in INDEXES:
+        table = apps.get_model('cities_light', model_name)._meta.db_table
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s '
+            'USING gin ((UPPER(name_ascii)) gin_trgm_ops)' % (
+                index_name, schema_editor.quote_name(table))
+        )
+
+
+def drop_name_ascii_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for model_name, index_name in INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % index_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cities_light', '0009_slug_cached_slugify'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_name_ascii_trgm_indexes,
+            drop_name_ascii_trgm_indexes,
+        ),
+    ]
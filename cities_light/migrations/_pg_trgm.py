@@ -0,0 +1,35 @@
+"""Helpers shared by the PostgreSQL trigram index migrations."""
+
+import logging
+
+from django.db import DatabaseError, transaction
+
+logger = logging.getLogger('cities_light')
+
+
+def create_pg_trgm_extension(schema_editor):
+    """
+    Make sure the pg_trgm extension is installed, return False if it is not.
+
+    Creating an extension requires superuser before PostgreSQL 13 and the
+    CREATE privilege on the database after, if the database role lacks them
+    a warning is logged and the trigram indexes are skipped instead of
+    failing the migration.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if cursor.fetchone():
+            return True
+
+    try:
+        # savepoint, so that a failure does not abort the migration
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    except DatabaseError as e:
+        logger.warning(
+            'Could not create the pg_trgm extension, skipping trigram '
+            'indexes. Run CREATE EXTENSION pg_trgm as a privileged user and '
+            'migrate cities_light back and forth to add them: %s' % e)
+        return False
+
+    return True
@@ -74,18 +74,27 @@ That's all!
     - if in further versions of cities_light abstract models will be
       updated (some fields will be added/removed), you have to deal with
       south_migrations by yourself, as models are on your own now.
+    - on PostgreSQL, cities_light migrations add a ``pg_trgm`` GIN index on
+      ``City.search_names`` (see ``0003_city_search_names_trgm``), you may
+      want to copy that migration for your own City model. Creating the
+      ``pg_trgm`` extension requires superuser before PostgreSQL 13 and the
+      CREATE privilege on the database after: if the migrating role lacks
+      them, run ``CREATE EXTENSION pg_trgm`` beforehand, otherwise the
+      trigram indexes are skipped with a warning.
 """
 
 # some imports are present for backwards compatibility and migration process
 from .abstract_models import (AbstractCountry, AbstractRegion, AbstractCity,
-    ToSearchTextField, CONTINENT_CHOICES, to_search, to_ascii)
+    ToSearchTextField, CONTINENT_CHOICES, to_search, to_search_array,
+    to_ascii)
 from .signals import *
 from .receivers import *
 from .settings import *
 
 from hvad.models import TranslatedFields
 
-__all__ = ['CONTINENT_CHOICES', 'to_search', 'to_ascii', 'filter_non_cities',
+__all__ = ['CONTINENT_CHOICES', 'to_search', 'to_search_array', 'to_ascii',
+    'filter_non_cities',
     'filter_non_included_countries_country',
     'filter_non_included_countries_region',
     'filter_non_included_countries_city']
@@ -1,5 +1,7 @@
+from django.conf import settings
+from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import signals
-from .abstract_models import to_ascii, to_search
+from .abstract_models import to_ascii, to_search_array
 from .settings import *
 from .signals import *
 from .exceptions import *
@@ -30,6 +32,70 @@ def city_country(sender, instance, **kwargs):
         instance.country = instance.region.country
 
 
+def _in_cache_language(instance):
+    """
+    Return True if instance is loaded in settings.LANGUAGE_CODE, the only
+    language City.region_name_cache and City.country_name_cache are kept in.
+    """
+    try:
+        return instance.language_code == settings.LANGUAGE_CODE
+    except (AttributeError, ObjectDoesNotExist):
+        return False
+
+
+def _cache_language_name(instance):
+    """
+    Return the name of instance in settings.LANGUAGE_CODE, or '' if it has
+    no translation in that language.
+    """
+    if _in_cache_language(instance):
+        return instance.name
+
+    return instance.translations.filter(
+        language_code=settings.LANGUAGE_CODE
+    ).values_list('name', flat=True).first() or ''
+
+
+def city_name_caches(sender, instance, **kwargs):
+    """
+    Set instance.region_name_cache and instance.country_name_cache from the
+    related region and country names in settings.LANGUAGE_CODE.
+    """
+    instance.country_name_cache = _cache_language_name(instance.country)
+
+    instance.region_name_cache = ''
+    if instance.region_id:
+        try:
+            instance.region_name_cache = _cache_language_name(
+                instance.region)
+        except ObjectDoesNotExist:
+            pass
+
+
+def update_city_country_name_cache(sender, instance, **kwargs):
+    """
+    Propagate a country name saved in settings.LANGUAGE_CODE to
+    City.country_name_cache.
+    """
+    if not _in_cache_language(instance):
+        return
+
+    instance.city_set.exclude(country_name_cache=instance.name).update(
+        country_name_cache=instance.name)
+
+
+def update_city_region_name_cache(sender, instance, **kwargs):
+    """
+    Propagate a region name saved in settings.LANGUAGE_CODE to
+    City.region_name_cache.
+    """
+    if not _in_cache_language(instance):
+        return
+
+    instance.city_set.exclude(region_name_cache=instance.name).update(
+        region_name_cache=instance.name)
+
+
 def city_search_names(sender, instance, **kwargs):
     search_names = set()
 
@@ -43,11 +109,13 @@ def city_search_names(sender, instance, **kwargs):
         for n in instance.alternate_names.split(';'):
             city_names.add(n)
 
-    try:
-        instance.region.name
-        regoin_flag = True
-    except:
-        regoin_flag = False
+    regoin_flag = False
+    if instance.region_id:
+        try:
+            instance.region.name
+            regoin_flag = True
+        except ObjectDoesNotExist:
+            pass
 
     if instance.region_id and regoin_flag:
         region_names = set((instance.region.name,))
@@ -57,15 +125,19 @@ def city_search_names(sender, instance, **kwargs):
     else:
         region_names = set()
 
+    # to_search(a + b) == to_search(a) + to_search(b): convert every name
+    # once instead of once per combination
+    city_names = set(to_search_array(city_names))
+    region_names = set(to_search_array(region_names))
+    country_names = set(to_search_array(country_names))
+
     for city_name in city_names:
         for country_name in country_names:
-            name = to_search(city_name + country_name)
-            search_names.add(name)
+            search_names.add(city_name + country_name)
 
             if instance.region_id and regoin_flag:
                 for region_name in region_names:
-                    name = to_search(city_name + region_name + country_name)
-                    search_names.add(name)
+                    search_names.add(city_name + region_name + country_name)
 
     instance.search_names = ' '.join(sorted(search_names))
 
@@ -78,13 +150,18 @@ def connect_default_signals(model_class):
     """
     if 'Country' in model_class.__name__:
         signals.pre_save.connect(set_name_ascii, sender=model_class)
+        signals.post_save.connect(update_city_country_name_cache,
+                                  sender=model_class)
     if 'Region' in model_class.__name__:
         signals.pre_save.connect(set_name_ascii, sender=model_class)
         signals.pre_save.connect(set_display_name, sender=model_class)
+        signals.post_save.connect(update_city_region_name_cache,
+                                  sender=model_class)
     if 'City' in model_class.__name__:
         signals.pre_save.connect(set_name_ascii, sender=model_class)
-        signals.pre_save.connect(set_display_name, sender=model_class)
         signals.pre_save.connect(city_country, sender=model_class)
+        signals.pre_save.connect(city_name_caches, sender=model_class)
+        signals.pre_save.connect(set_display_name, sender=model_class)
         signals.pre_save.connect(city_search_names, sender=model_class)
 
 
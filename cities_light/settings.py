@@ -77,10 +77,10 @@ because it's probably project specific.
 
 .. py:data:: INDEX_SEARCH_NAMES
 
-    If your database engine for cities_light supports indexing TextFields (ie.
-    it is **not** MySQL), then this should be set to True. You might have to
-    override this setting with ``settings.CITIES_LIGHT_INDEX_SEARCH_NAMES`` if
-    using several databases for your project.
+    Deprecated, ``City.search_names`` no longer has a b-tree index whatever
+    the value of this setting: it is searched with ``icontains`` which a
+    b-tree can't serve. On PostgreSQL, cities_light migrations create a
+    ``pg_trgm`` GIN index on it instead.
 
 .. py:data:: CITIES_LIGHT_APP_NAME
 
@@ -6,8 +6,10 @@ from django import test
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth import get_user_model
+from django.core import management
 from django.core.exceptions import ValidationError
 
+from ..abstract_models import to_ascii, to_search, to_search_array
 from ..loading import get_cities_model
 from ..validators import timezone_validator
 
@@ -49,6 +51,31 @@ class TestModels(test.TransactionTestCase):
         )
         self.assertEqual(city.get_timezone_info().zone, settings.TIME_ZONE)
 
+    def test_to_ascii(self):
+        """Test to_ascii on ascii, latin and non-latin values."""
+        self.assertEqual(to_ascii('Paris'), 'Paris')
+        self.assertEqual(to_ascii(''), '')
+        self.assertEqual(
+            to_ascii('République Française'), 'Republique Francaise')
+        self.assertEqual(to_ascii('Łódź'), 'Lodz')
+        self.assertEqual(to_ascii('Кемерово'), 'Kemerovo')
+
+    def test_to_search(self):
+        """Test to_search strips everything but lowercase letters/digits."""
+        self.assertEqual(to_search('Paris Texas'), 'paristexas')
+        self.assertEqual(to_search("Saint-Jean-d'Angély"), 'saintjeandangely')
+        self.assertEqual(to_search('Kemerovo_2'), 'kemerovo2')
+        self.assertEqual(to_search('Кемерово'), 'kemerovo')
+
+    def test_to_search_array(self):
+        """Test to_search_array matches to_search on concatenations."""
+        names = ['Angoulême', 'Poitou-Charentes', 'Кемерово', 'France']
+        self.assertEqual(
+            to_search_array(names),
+            ['angouleme', 'poitoucharentes', 'kemerovo', 'france'])
+        self.assertEqual(''.join(to_search_array(names)),
+                         to_search(''.join(names)))
+
     def test_timezone_validator(self):
         """Test timezone_validator."""
         with self.assertRaises(ValidationError) as e:
@@ -143,14 +170,89 @@ class TestModels(test.TransactionTestCase):
 
         city_qs = city_model.objects.filter(
             search_names__icontains='Region Country'
-        )
+        ).order_by('name_ascii')
         self.assertEqual(len(city_qs), 2, msg='Should find 2 cities')
         self.assertEqual(city_qs[0].name, city1.name)
         self.assertEqual(city_qs[1].name, city2.name)
 
         city_qs = city_model.objects.filter(
             search_names__icontains='gion coun'
-        )
+        ).order_by('name_ascii')
         self.assertEqual(len(city_qs), 2, msg='Should find 2 cities')
         self.assertEqual(city_qs[0].name, city1.name)
         self.assertEqual(city_qs[1].name, city2.name)
+
+    def _create_city(self):
+        """Create a City with its Region and Country."""
+        country = get_cities_model('Country')(
+            name='Country',
+            geoname_id='123456',
+            continent='EU')
+        country.save()
+
+        region = get_cities_model('Region')(
+            name='Region',
+            geoname_id='123457',
+            country=country)
+        region.save()
+
+        city = get_cities_model('City')(
+            name='City',
+            geoname_id='123458',
+            region=region,
+            country=country)
+        city.save()
+
+        return city
+
+    def test_city_name_caches(self):
+        """Test City name caches are set on save."""
+        city = self._create_city()
+
+        self.assertEqual(city.region_name_cache, 'Region')
+        self.assertEqual(city.country_name_cache, 'Country')
+        self.assertEqual(city.get_display_name(), 'City, Region, Country')
+
+    def test_city_name_caches_rename(self):
+        """Test Country/Region renames are propagated to City caches."""
+        city_model = get_cities_model('City')
+        city = self._create_city()
+
+        country = city.country
+        country.name = 'Renamed Country'
+        country.save()
+
+        region = city.region
+        region.name = 'Renamed Region'
+        region.save()
+
+        city = city_model.objects.get(pk=city.pk)
+        self.assertEqual(city.region_name_cache, 'Renamed Region')
+        self.assertEqual(city.country_name_cache, 'Renamed Country')
+        self.assertEqual(city.get_display_name(),
+                         'City, Renamed Region, Renamed Country')
+
+    def test_city_name_caches_other_language(self):
+        """Test translations in other languages are not propagated."""
+        city_model = get_cities_model('City')
+        city = self._create_city()
+        other_language = 'ru' if settings.LANGUAGE_CODE != 'ru' else 'en'
+
+        country = city.country.translate(other_language)
+        country.name = 'Other Country'
+        country.save()
+
+        city = city_model.objects.get(pk=city.pk)
+        self.assertEqual(city.country_name_cache, 'Country')
+
+    def test_rebuild_city_denorm(self):
+        """Test rebuild_city_denorm command fills City caches."""
+        city_model = get_cities_model('City')
+        city = self._create_city()
+        city_model.objects.update(region_name_cache='', country_name_cache='')
+
+        management.call_command('rebuild_city_denorm')
+
+        city = city_model.objects.get(pk=city.pk)
+        self.assertEqual(city.region_name_cache, 'Region')
+        self.assertEqual(city.country_name_cache, 'Country')
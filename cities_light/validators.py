@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
 
 
+from functools import lru_cache
+
 import pytz
 from django.core.exceptions import ValidationError
 from django.utils.translation import ugettext_lazy as _
 
 
+@lru_cache(maxsize=1024)
+def get_timezone(name):
+    """Return pytz.timezone(name), memoized per timezone name."""
+    return pytz.timezone(name)
+
+
 def timezone_validator(value):
     """Timezone validator."""
     try:
-        return pytz.timezone(value)
+        return get_timezone(value)
     except (pytz.UnknownTimeZoneError, AttributeError):
         raise ValidationError(
             _('Timezone validation error: %(value)s'),